@@ -1,42 +1,75 @@
-import sys
 import subprocess
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, ttk
 import os
 import urllib.request
+import venv
 import shutil
 import platform
 import threading
+import queue
 import ctypes
+import io
+import codecs
+import locale
+import functools
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 # ------------------------------------------------------------------------
 # 0. Configuration & Constants
 # ------------------------------------------------------------------------
 
+# Downloaded installers live in a per-user cache so re-runs from any directory reuse them
+CACHE_DIR = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', '.cache')),
+    'backup-installer'
+)
+os.makedirs(CACHE_DIR, exist_ok=True)
+
 BUILD_TOOLS_URL = "https://aka.ms/vs/17/release/vs_buildtools.exe"
 BUILD_TOOLS_FILENAME = "vs_buildtools.exe"
-BUILD_TOOLS_PATH = os.path.join(os.getcwd(), BUILD_TOOLS_FILENAME)
+BUILD_TOOLS_PATH = os.path.join(CACHE_DIR, BUILD_TOOLS_FILENAME)
 
 # Official Rust “rustup-init” endpoints
 RUSTUP_EXE_64_WIN = "https://win.rustup.rs/x86_64"
 RUSTUP_EXE_32_WIN = "https://win.rustup.rs/i686"
 RUSTUP_INIT_EXE = "rustup-init.exe"
+RUSTUP_INIT_PATH = os.path.join(CACHE_DIR, RUSTUP_INIT_EXE)
+
+# Read downloads in 1 MiB chunks and refresh the progress bar at most once per MiB
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PROGRESS_UPDATE_BYTES = 1024 * 1024
+
+# Subprocess output is read up to 64 KiB at a time rather than line by line
+PIPE_READ_SIZE = 64 * 1024
 
 PACKAGES = [
     'pywin32',
-    'pyminizip',
+    'pyzipper',
+    'deflate',
     'google-api-python-client',
     'google-auth-httplib2',
     'google-auth-oauthlib',
     'cryptography',
-    'schedule'
+    'schedule',
+    'zstandard',
+    'mgzip',
+    'py-cpuinfo'
 ]
 
 VENV_DIR = 'env'
+VENV_PATH = os.path.join(os.getcwd(), VENV_DIR)
 BACKUP_SCRIPT_NAME = 'backup_script.py'
 
 SPECIFIC_SETUPTOOLS_VERSION = '68.0.0'
 
+# Skip pip's self-update probe and never block on an interactive prompt
+PIP_INSTALL_FLAGS = ['--disable-pip-version-check', '--no-input']
+
+# Set once uv has been installed into the venv (see install_uv)
+USE_UV = False
+
 IS_WINDOWS = (platform.system().lower() == 'windows')
 
 # ------------------------------------------------------------------------
@@ -56,21 +89,104 @@ def is_admin_windows():
 # Helper: Path to the venv's python.exe (Method #1)
 # ------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def get_venv_python():
     """
     Returns the full path to the venv's Python interpreter.
     We'll use it with '-m pip install' calls to ensure everything
     runs inside the virtual environment's Python process.
     """
-    if platform.system().lower() == 'windows':
-        return os.path.join(os.getcwd(), VENV_DIR, 'Scripts', 'python.exe')
+    if IS_WINDOWS:
+        return os.path.join(VENV_PATH, 'Scripts', 'python.exe')
     else:
-        return os.path.join(os.getcwd(), VENV_DIR, 'bin', 'python')
+        return os.path.join(VENV_PATH, 'bin', 'python')
+
+# ------------------------------------------------------------------------
+# Helper: Skip downloads we already have
+# ------------------------------------------------------------------------
+
+def _needs_download(url, path):
+    """
+    Returns False if 'path' already holds the file served at 'url', judged by
+    comparing its size to the Content-Length of a HEAD request. If the server
+    can't be asked (or doesn't say), an existing file is trusted as-is.
+    """
+    if not os.path.exists(path):
+        return True
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, method='HEAD')) as response:
+            content_length = response.getheader('content-length')
+    except Exception:
+        return False
+    if not content_length:
+        return False
+    return os.path.getsize(path) != int(content_length)
+
+# ------------------------------------------------------------------------
+# Helper: Run a subprocess and stream its output to the console
+# ------------------------------------------------------------------------
+
+def _pipe_reader(pipe, name, chunk_queue):
+    """
+    Pushes (name, text) tuples from a binary pipe onto chunk_queue, reading up to
+    PIPE_READ_SIZE bytes at a time, then (name, None) at EOF.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors='replace'),
+        translate=True
+    )
+    try:
+        while True:
+            # read1 returns whatever is available (up to the limit) instead of waiting for a full buffer
+            chunk = pipe.read1(PIPE_READ_SIZE)
+            if not chunk:
+                break
+            text = decoder.decode(chunk)
+            if text:
+                chunk_queue.put((name, text))
+        text = decoder.decode(b'', final=True)
+        if text:
+            chunk_queue.put((name, text))
+    finally:
+        pipe.close()
+        chunk_queue.put((name, None))
+
+def _stream_subprocess(cmd, env=None):
+    """
+    Runs cmd, draining stdout and stderr concurrently on daemon threads so
+    a full pipe can never stall the child. Output is read in large chunks
+    and forwarded to the console via append_output.
+    Returns (returncode, stderr_text).
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env
+    )
+    chunk_queue = queue.Queue()
+    for pipe, name in ((process.stdout, 'stdout'), (process.stderr, 'stderr')):
+        threading.Thread(target=_pipe_reader, args=(pipe, name, chunk_queue), daemon=True).start()
+
+    stderr_chunks = []
+    open_pipes = 2
+    while open_pipes:
+        name, text = chunk_queue.get()
+        if text is None:
+            open_pipes -= 1
+            continue
+        if name == 'stderr':
+            stderr_chunks.append(text)
+        append_output(text)
+
+    process.wait()
+    return process.returncode, ''.join(stderr_chunks)
 
 # ------------------------------------------------------------------------
 # 1. Windows-Specific: Build Tools
 # ------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def locate_vcvarsall_bat():
     candidate_paths = [
         r"C:\BuildTools\VC\Auxiliary\Build\vcvarsall.bat",
@@ -100,6 +216,23 @@ def locate_vcvarsall_bat():
     return None
 
 def get_msvc_env(bitness="x64"):
+    """
+    Returns a copy of the environment produced by vcvarsall.bat for 'bitness',
+    or None if it could not be captured. The shell-out is cached per bitness.
+    """
+    # Already inside a Developer Command Prompt: nothing to capture
+    if os.environ.get("VSCMD_VER"):
+        return dict(os.environ)
+    msvc_env = _capture_msvc_env(bitness)
+    if msvc_env is None:
+        # Don't remember failures; Build Tools may be installed before the next attempt
+        _capture_msvc_env.cache_clear()
+        locate_vcvarsall_bat.cache_clear()
+        return None
+    return dict(msvc_env)
+
+@functools.lru_cache(maxsize=4)
+def _capture_msvc_env(bitness):
     vcvarsall_path = locate_vcvarsall_bat()
     if not vcvarsall_path:
         append_output("[WARNING] Could not locate vcvarsall.bat. Some builds may fail.\n\n")
@@ -112,15 +245,38 @@ def get_msvc_env(bitness="x64"):
         append_output(f"[WARNING] Failed to call vcvarsall.bat:\n{e}\n\n")
         return None
 
-    new_env = dict(os.environ)
+    # Keep the case vcvarsall reports (e.g. 'Path'), but drop any differently-cased
+    # copy inherited from os.environ; Windows treats the two as the same variable.
+    new_env = os.environ.copy()
+    folded_keys = {key.upper(): key for key in new_env}
     for line in output.splitlines():
-        if '=' in line:
-            key, val = line.split('=', 1)
-            new_env[key.upper()] = val
-    return new_env
+        key, sep, val = line.partition('=')
+        if not sep:
+            continue
+        existing = folded_keys.get(key.upper())
+        if existing is not None and existing != key:
+            del new_env[existing]
+        new_env[key] = val
+        folded_keys[key.upper()] = key
+    return types.MappingProxyType(new_env)
+
+def _enum_subkey_names(key):
+    """Yields subkey names of an open registry key until the enumeration runs out."""
+    import winreg
+    index = 0
+    while True:
+        try:
+            yield winreg.EnumKey(key, index)
+        except OSError:
+            return
+        index += 1
 
+@functools.lru_cache(maxsize=1)
 def is_build_tools_installed():
-    """Checks if Microsoft C++ Build Tools are installed by examining registry. Skip on non-Windows."""
+    """
+    Checks if Microsoft C++ Build Tools are installed by examining registry. Skip on non-Windows.
+    The result is cached for the session; install_build_tools() clears it.
+    """
     if not IS_WINDOWS:
         return True
     import winreg
@@ -135,21 +291,16 @@ def is_build_tools_installed():
         return False
 
     try:
-        for i in range(winreg.QueryInfoKey(key)[0]):
-            subkey_name = winreg.EnumKey(key, i)
-            subkey_path = f"SOFTWARE\\Microsoft\\VisualStudio\\Installer\\Products\\{subkey_name}"
-            subkey = winreg.OpenKey(
-                winreg.HKEY_LOCAL_MACHINE,
-                subkey_path,
-                0,
-                winreg.KEY_READ | winreg.KEY_WOW64_64KEY
-            )
-            try:
-                product_id, _ = winreg.QueryValueEx(subkey, "ProductID")
+        with key:
+            for subkey_name in _enum_subkey_names(key):
+                # Open relative to the already-open parent instead of re-resolving from HKLM
+                with winreg.OpenKey(key, subkey_name, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY) as subkey:
+                    try:
+                        product_id, _ = winreg.QueryValueEx(subkey, "ProductID")
+                    except FileNotFoundError:
+                        continue
                 if "Microsoft.VisualStudio.Workload.VCTools" in product_id:
                     return True
-            except FileNotFoundError:
-                continue
     except Exception as e:
         append_output(f"Error checking Build Tools installation: {e}\n\n")
         return False
@@ -157,29 +308,31 @@ def is_build_tools_installed():
     return False
 
 def download_build_tools():
-    if os.path.exists(BUILD_TOOLS_PATH):
+    if not _needs_download(BUILD_TOOLS_URL, BUILD_TOOLS_PATH):
         append_output("Build Tools installer already downloaded.\n\n")
         return True
     try:
         append_output("Downloading Microsoft C++ Build Tools...\n")
-        with urllib.request.urlopen(BUILD_TOOLS_URL) as response, open(BUILD_TOOLS_FILENAME, 'wb') as out_file:
+        with urllib.request.urlopen(BUILD_TOOLS_URL) as response, open(BUILD_TOOLS_PATH, 'wb') as out_file:
             total_length = response.getheader('content-length')
             if total_length:
                 total_length = int(total_length)
                 downloaded = 0
-                chunk_size = 8192
+                next_update = 0
                 while True:
-                    data = response.read(chunk_size)
+                    data = response.read(DOWNLOAD_CHUNK_SIZE)
                     if not data:
                         break
                     out_file.write(data)
                     downloaded += len(data)
-                    percent = downloaded * 100 / total_length
-                    progress_var.set(percent)
-                    append_output(f"Downloaded {percent:.2f}%\r")
-                    root.update_idletasks()
+                    # Only touch the Tk widgets once per MiB (and on the last chunk)
+                    if downloaded >= next_update or downloaded >= total_length:
+                        next_update = downloaded + PROGRESS_UPDATE_BYTES
+                        percent = downloaded * 100 / total_length
+                        root.after(0, progress_var.set, percent)
+                        append_output(f"Downloaded {percent:.2f}%\r")
             else:
-                shutil.copyfileobj(response, out_file)
+                shutil.copyfileobj(response, out_file, length=DOWNLOAD_CHUNK_SIZE)
         append_output("\nDownload completed successfully.\n\n")
         return True
     except Exception as e:
@@ -201,25 +354,21 @@ def install_build_tools():
             "--norestart",
             "--nocache",
             "--installPath", "C:\\BuildTools",
-            "--add", "Microsoft.VisualStudio.Workload.NativeDesktop",
+            # Only the MSVC compiler/linker and the Windows SDK headers/libs are needed
+            # to build native extensions such as cryptography; the full NativeDesktop
+            # workload (ATL, MFC, CMake, Clang, ...) is gigabytes we never use.
             "--add", "Microsoft.VisualStudio.Component.VC.Tools.x86.x64",
-            "--add", "Microsoft.VisualStudio.Component.Windows10SDK.19041",
-            "--includeRecommended"
+            "--add", "Microsoft.VisualStudio.Component.Windows10SDK.19041"
         ]
 
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        for line in iter(process.stdout.readline, ''):
-            append_output(line)
-        process.stdout.close()
-        stderr = process.stderr.read()
-        process.stderr.close()
-        process.wait()
+        returncode, stderr = _stream_subprocess(cmd)
 
-        if process.returncode != 0:
+        if returncode != 0:
             append_output(f"Build Tools installation failed.\nError: {stderr}\n\n")
             messagebox.showerror("Installation Error", f"Failed to install Build Tools.\nError: {stderr}")
             return False
 
+        is_build_tools_installed.cache_clear()
         append_output("Microsoft C++ Build Tools installed successfully.\n\n")
         append_output("You may need to reboot or open a new terminal so 'cl.exe' is on PATH.\n\n")
         return True
@@ -236,7 +385,8 @@ def install_build_tools():
 def create_virtual_environment():
     try:
         append_output("Creating virtual environment...\n")
-        subprocess.check_call([sys.executable, '-m', 'venv', VENV_DIR])
+        # Build in-process rather than booting another interpreter for '-m venv'
+        venv.EnvBuilder(with_pip=True, symlinks=not IS_WINDOWS).create(VENV_PATH)
         append_output("Virtual environment created successfully.\n\n")
         return True
     except subprocess.CalledProcessError as e:
@@ -253,32 +403,26 @@ def create_virtual_environment():
 # ------------------------------------------------------------------------
 
 def is_rust_installed():
-    try:
-        subprocess.check_output(["rustc", "--version"], text=True)
-        return True
-    except Exception:
-        return False
+    # A PATH lookup is enough; spawning rustc just to read its version is not needed
+    return shutil.which("rustc") is not None
 
 def install_rust_windows():
     arch = platform.architecture()[0]
     rustup_url = RUSTUP_EXE_64_WIN if arch == "64bit" else RUSTUP_EXE_32_WIN
 
     try:
-        append_output("Downloading rustup-init.exe...\n")
-        with urllib.request.urlopen(rustup_url) as response, open(RUSTUP_INIT_EXE, "wb") as out_file:
-            shutil.copyfileobj(response, out_file)
-        append_output("Downloaded rustup-init.exe successfully.\n")
-
-        cmd = [os.path.join(os.getcwd(), RUSTUP_INIT_EXE), "-y", "--default-toolchain", "stable"]
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        for line in iter(process.stdout.readline, ''):
-            append_output(line)
-        process.stdout.close()
-        stderr = process.stderr.read()
-        process.stderr.close()
-        process.wait()
-
-        if process.returncode != 0:
+        if _needs_download(rustup_url, RUSTUP_INIT_PATH):
+            append_output("Downloading rustup-init.exe...\n")
+            with urllib.request.urlopen(rustup_url) as response, open(RUSTUP_INIT_PATH, "wb") as out_file:
+                shutil.copyfileobj(response, out_file, length=DOWNLOAD_CHUNK_SIZE)
+            append_output("Downloaded rustup-init.exe successfully.\n")
+        else:
+            append_output("rustup-init.exe already downloaded.\n")
+
+        cmd = [RUSTUP_INIT_PATH, "-y", "--default-toolchain", "stable"]
+        returncode, stderr = _stream_subprocess(cmd)
+
+        if returncode != 0:
             append_output(f"Rust installation failed.\nError: {stderr}\n\n")
             return False
 
@@ -292,15 +436,9 @@ def install_rust_unix():
     try:
         append_output("Installing Rust via rustup (macOS/Linux)...\n")
         cmd = ['sh', '-c', "curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y"]
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=False)
-        for line in iter(process.stdout.readline, ''):
-            append_output(line)
-        process.stdout.close()
-        stderr = process.stderr.read()
-        process.stderr.close()
-        process.wait()
-
-        if process.returncode != 0:
+        returncode, stderr = _stream_subprocess(cmd)
+
+        if returncode != 0:
             append_output(f"Rust installation failed on macOS/Linux.\nError: {stderr}\n\n")
             return False
 
@@ -329,33 +467,20 @@ def upgrade_pip_setuptools_wheel(_unused, specific_setuptools_version=None, env_
     venv_python = get_venv_python()
     try:
         if specific_setuptools_version:
-            # Install pinned setuptools
-            append_output(f"Installing setuptools=={specific_setuptools_version}...\n")
+            # Upgrade pip and install pinned setuptools in one pip run
+            append_output(f"Upgrading pip and installing setuptools=={specific_setuptools_version}...\n")
             subprocess.check_call(
-                [venv_python, '-m', 'pip', 'install', f'setuptools=={specific_setuptools_version}'],
-                env=env_vars
-            )
-            append_output(f"setuptools=={specific_setuptools_version} installed successfully.\n\n")
-
-            # Then upgrade pip
-            append_output("Upgrading pip...\n")
-            subprocess.check_call(
-                [venv_python, '-m', 'pip', 'install', '--upgrade', 'pip'],
+                [venv_python, '-m', 'pip', 'install', *PIP_INSTALL_FLAGS,
+                 '--upgrade', 'pip', f'setuptools=={specific_setuptools_version}'],
                 env=env_vars
             )
             append_output("Successfully upgraded pip, and installed the correct setuptools.\n\n")
 
         else:
-            # If no pinned version, upgrade setuptools and wheel
-            append_output("Upgrading setuptools...\n")
+            # If no pinned version, upgrade setuptools and wheel together
+            append_output("Upgrading setuptools and wheel...\n")
             subprocess.check_call(
-                [venv_python, '-m', 'pip', 'install', '--upgrade', 'setuptools'],
-                env=env_vars
-            )
-
-            append_output("Upgrading wheel...\n")
-            subprocess.check_call(
-                [venv_python, '-m', 'pip', 'install', '--upgrade', 'wheel'],
+                [venv_python, '-m', 'pip', 'install', *PIP_INSTALL_FLAGS, '--upgrade', 'setuptools', 'wheel'],
                 env=env_vars
             )
             append_output("setuptools and wheel have been upgraded successfully.\n\n")
@@ -369,62 +494,83 @@ def upgrade_pip_setuptools_wheel(_unused, specific_setuptools_version=None, env_
         messagebox.showerror("Unexpected Error", "An unexpected error occurred during upgrades.")
         return False
 
+def install_uv(venv_python, env_vars=None):
+    """
+    Installs uv into the venv so later installs can use its Rust resolver and
+    parallel downloads. Returns False (and pip is used instead) if that fails.
+    """
+    global USE_UV
+    append_output("Installing uv for faster package installation...\n")
+    try:
+        subprocess.check_call(
+            [venv_python, '-m', 'pip', 'install', *PIP_INSTALL_FLAGS, 'uv'],
+            env=env_vars
+        )
+        USE_UV = True
+        append_output("uv installed successfully.\n\n")
+    except Exception as e:
+        USE_UV = False
+        append_output(f"[WARNING] Could not install uv, falling back to pip. Error:\n{e}\n\n")
+    return USE_UV
+
+def pip_install_command(venv_python, packages, only_binary=False):
+    """
+    Builds the install command for 'packages', using uv when it is available in the venv.
+    With only_binary=True, source distributions are refused (prebuilt wheels only).
+    """
+    extra = ['--only-binary=:all:'] if only_binary else []
+    if USE_UV:
+        return [venv_python, '-m', 'uv', 'pip', 'install', '--python', venv_python, *extra, *packages]
+    return [venv_python, '-m', 'pip', 'install', *PIP_INSTALL_FLAGS, *extra, *packages]
+
 def install_packages(_unused, env_vars=None):
     """
     Installs PACKAGES by calling the venv python with -m pip in real-time.
+    Everything except cryptography goes through a single pip invocation;
+    cryptography is installed afterwards because it may need the Rust fallback.
     """
     venv_python = get_venv_python()
-    for package in PACKAGES:
-        if package.lower() == 'cryptography':
-            if install_cryptography_with_fallback(venv_python, env_vars):
-                continue
-            else:
-                messagebox.showerror(
-                    "Installation Error",
-                    "Failed to install cryptography (and fallback), even after Rust installation attempts."
-                )
-                return
-        else:
-            if not try_install_package_realtime(venv_python, package, env_vars=env_vars):
-                return
-
-    # Re-upgrade setuptools after all packages
-    append_output("Re-upgrading setuptools to the latest version...\n")
-    if upgrade_pip_setuptools_wheel(None, env_vars=env_vars):
-        append_output("All packages have been installed successfully.\n\n")
-        messagebox.showinfo("Installation Complete", "All packages have been installed successfully.")
-    else:
-        append_output("Failed to re-upgrade setuptools.\n\n")
-        messagebox.showwarning("Partial Installation", "Packages installed, but failed to re-upgrade setuptools.")
+    install_uv(venv_python, env_vars)
+    batch = [package for package in PACKAGES if package.lower() != 'cryptography']
+    if batch and not try_install_package_realtime(venv_python, batch, env_vars=env_vars):
+        return
 
-def try_install_package_realtime(venv_python, package, env_vars=None):
+    if len(batch) != len(PACKAGES):
+        if not install_cryptography_with_fallback(venv_python, env_vars):
+            messagebox.showerror(
+                "Installation Error",
+                "Failed to install cryptography (and fallback), even after Rust installation attempts."
+            )
+            return
+
+    append_output("All packages have been installed successfully.\n\n")
+    messagebox.showinfo("Installation Complete", "All packages have been installed successfully.")
+
+def try_install_package_realtime(venv_python, packages, env_vars=None, only_binary=False):
     """
-    Calls: venv_python -m pip install package
+    Calls: venv_python -m uv pip install (or -m pip install) package [package ...]
+    'packages' may be a single requirement string or a list of them.
+    With only_binary=True the attempt is a wheel-only probe, so a failure is
+    logged but no error dialog is shown.
     Streams output in real-time.
     """
+    if isinstance(packages, str):
+        packages = [packages]
+    package = ", ".join(packages)
     try:
         append_output(f"Installing {package}...\n")
-        process = subprocess.Popen(
-            [venv_python, '-m', 'pip', 'install', package],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+        returncode, stderr = _stream_subprocess(
+            pip_install_command(venv_python, packages, only_binary=only_binary),
             env=env_vars
         )
-        while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                append_output(output)
-        stdout, stderr = process.communicate()
 
-        if process.returncode == 0:
+        if returncode == 0:
             append_output(f"Successfully installed {package}.\n\n")
             return True
         else:
             append_output(f"Failed to install {package}. Error:\n{stderr}\n\n")
-            messagebox.showerror("Installation Error", f"Failed to install {package}. Check console for details.")
+            if not only_binary:
+                messagebox.showerror("Installation Error", f"Failed to install {package}. Check console for details.")
             return False
     except subprocess.CalledProcessError as e:
         append_output(f"Failed to install {package}. Error:\n{e}\n\n")
@@ -437,10 +583,15 @@ def try_install_package_realtime(venv_python, package, env_vars=None):
 
 def install_cryptography_with_fallback(venv_python, env_vars=None):
     """
+    0) Try a prebuilt cryptography wheel (no compiler or Rust needed)
     1) Try cryptography
     2) If fail, try cryptography<38
     3) If still fail, install Rust and re-try
     """
+    if try_install_package_realtime(venv_python, 'cryptography', env_vars, only_binary=True):
+        return True
+
+    append_output("No prebuilt cryptography wheel for this platform. Trying a source build...\n")
     if try_install_package_realtime(venv_python, 'cryptography', env_vars):
         return True
 
@@ -493,11 +644,28 @@ root.resizable(False, False)
 
 progress_var = tk.DoubleVar()
 
+# Console text is queued by any thread and written by _flush_log on the Tk thread
+_log_queue = queue.Queue()
+LOG_FLUSH_INTERVAL_MS = 50
+LOG_FLUSH_MAX_CHUNKS = 500
+
 def append_output(text):
-    output_console.configure(state='normal')
-    output_console.insert(tk.END, text)
-    output_console.see(tk.END)
-    output_console.configure(state='disabled')
+    _log_queue.put(text)
+
+def _flush_log():
+    """Moves pending console text into the widget with a single insert, then reschedules itself."""
+    pending = []
+    try:
+        while len(pending) < LOG_FLUSH_MAX_CHUNKS:
+            pending.append(_log_queue.get_nowait())
+    except queue.Empty:
+        pass
+    if pending:
+        output_console.configure(state='normal')
+        output_console.insert(tk.END, ''.join(pending))
+        output_console.see(tk.END)
+        output_console.configure(state='disabled')
+    root.after(LOG_FLUSH_INTERVAL_MS, _flush_log)
 
 def enable_install_button():
     install_button.config(state='normal')
@@ -516,21 +684,23 @@ def run_installation_process():
         return
 
     # 1. On Windows, check Build Tools
-    if not is_build_tools_installed():
-        if IS_WINDOWS:
-            if not download_build_tools():
-                enable_install_button()
-                return
-            if not install_build_tools():
-                enable_install_button()
-                return
-        else:
-            append_output("Non-Windows detected; skipping MS C++ Build Tools step.\n\n")
+    needs_build_tools = not is_build_tools_installed()
+    if needs_build_tools and not IS_WINDOWS:
+        append_output("Non-Windows detected; skipping MS C++ Build Tools step.\n\n")
+        needs_build_tools = False
 
-    # 2. Create Venv
-    if not create_virtual_environment():
-        enable_install_button()
-        return
+    # 2. Download Build Tools and create the venv concurrently; neither depends on the other
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        download_future = executor.submit(download_build_tools) if needs_build_tools else None
+        venv_future = executor.submit(create_virtual_environment)
+
+        if download_future and not (download_future.result() and install_build_tools()):
+            enable_install_button()
+            return
+
+        if not venv_future.result():
+            enable_install_button()
+            return
 
     # 3. If Windows, capture MSVC environment; if non-Windows, skip
     x64_env = None
@@ -552,13 +722,21 @@ def run_installation_process():
     else:
         append_output("Non-Windows detected; skipping MSVC environment setup.\n\n")
 
+    # Quiet pip's version check and prompts, and keep child output unbuffered so it streams live
+    env_vars = {
+        **(x64_env or os.environ),
+        'PIP_DISABLE_PIP_VERSION_CHECK': '1',
+        'PIP_NO_INPUT': '1',
+        'PYTHONUNBUFFERED': '1',
+    }
+
     # 4. Install specific setuptools version (which also upgrades pip)
-    if not upgrade_pip_setuptools_wheel(None, specific_setuptools_version=SPECIFIC_SETUPTOOLS_VERSION, env_vars=x64_env):
+    if not upgrade_pip_setuptools_wheel(None, specific_setuptools_version=SPECIFIC_SETUPTOOLS_VERSION, env_vars=env_vars):
         enable_install_button()
         return
 
     # 5. Install packages
-    install_packages(None, env_vars=x64_env)
+    install_packages(None, env_vars=env_vars)
 
     # 6. Generate batch file
     generate_run_backup_batch()
@@ -593,5 +771,6 @@ progress_bar.pack(pady=10)
 output_console = scrolledtext.ScrolledText(root, width=100, height=20, wrap=tk.WORD, state='disabled', font=("Courier", 10))
 output_console.pack(pady=10)
 append_output("Installation Output:\n\n")
+root.after(LOG_FLUSH_INTERVAL_MS, _flush_log)
 
 root.mainloop()
@@ -1,25 +1,60 @@
 import os
+import stat
 import shutil
 import zipfile
+import tarfile
+import zlib
+import mmap
 import logging
 import traceback
 from datetime import datetime
 from tkinter import (
     Tk, filedialog, messagebox, Button, Label,
-    ttk, BooleanVar, Checkbutton, simpledialog
+    ttk, BooleanVar, StringVar, Checkbutton, simpledialog
 )
 import threading
 import schedule
 import time
 import platform
-import pyminizip
+import pyzipper
+
+# libdeflate bindings (PyPI: deflate) are optional; stock zlib is used without them
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+# zstandard is optional; without it tar.zst archives can't be made
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# mgzip (multi-threaded gzip) is optional; without it tar.gz archives can't be made
+try:
+    import mgzip
+except ImportError:
+    mgzip = None
+
+# py-cpuinfo is optional; it's only used to report hardware crypto support
+try:
+    import cpuinfo
+except ImportError:
+    cpuinfo = None
 import pickle
+import functools
+import ctypes
+import ctypes.util
+from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Google Drive imports
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaUpload, build_http
+import google_auth_httplib2
 
 
 ##############################################################################
@@ -32,8 +67,53 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+logger = logging.getLogger(__name__)
+
+# Per-file details are only logged at DEBUG; a summary goes out every LOG_BATCH_FILES files
+LOG_BATCH_FILES = 1000
+
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+# Parallel ZIP compression: files are grouped into ~4 MiB work packages and
+# DEFLATEd in worker processes; compressible files above LARGE_FILE_THRESHOLD
+# are streamed by ZipFile itself so they never have to fit in memory.
+# COMPRESSION_LEVEL may be 1-12 with libdeflate; zlib tops out at 9.
+COMPRESSION_LEVEL = 6
+WORK_PACKAGE_BYTES = 4 * 1024 * 1024
+LARGE_FILE_THRESHOLD = 64 * 1024 * 1024
+# Most file data held by work packages that are queued or waiting to be written
+MAX_IN_FLIGHT_BYTES = 256 * 1024 * 1024
+# Files at least this big are memory-mapped by the workers instead of read()
+MMAP_THRESHOLD = 1024 * 1024
+# Already-compressed formats; these are stored in ZIPs rather than deflated again
+INCOMPRESSIBLE_EXTENSIONS = frozenset({
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z', '.rar',
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic',
+    '.mp4', '.mkv', '.mov', '.avi', '.webm', '.mp3', '.m4a', '.aac', '.ogg', '.flac',
+    '.docx', '.xlsx', '.pptx', '.jar', '.apk',
+})
+# Rough compressed/original size ratio, used to preallocate ZIP files
+ZIP_SIZE_ESTIMATE = 0.6
+# Stored file data is copied into the ZIP by the kernel where sendfile works on regular files
+USE_SENDFILE = platform.system() == "Linux" and hasattr(os, 'sendfile')
+# With more free space than this at the destination, the source isn't measured before asking to proceed
+SPACE_CHECK_SKIP_BYTES = 10 * 1024**3
+
+# Archive formats offered in the GUI. Encrypted backups are always ZIP.
+ARCHIVE_FORMATS = ('zip', 'tar.zst', 'tar.gz')
+ZSTD_LEVEL = 3
+# Input block size mgzip compresses per thread for tar.gz
+GZIP_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Backups that are uploaded are split into ZIP volumes of about this size; each
+# becomes its own Drive file and starts uploading as soon as it is opened.
+UPLOAD_VOLUME_SIZE = 512 * 1024 * 1024
+
+# Google Drive uploads are resumable and sent in 8 MiB chunks (must be a multiple
+# of 256 KiB); several files are uploaded side by side.
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+MAX_PARALLEL_UPLOADS = 4
+
 
 ##############################################################################
 # UTILITY & ERROR LOGGING
@@ -45,6 +125,59 @@ def log_exception(e):
     logging.error(traceback.format_exc())
 
 
+@functools.lru_cache(maxsize=1)
+def get_cpu_capabilities():
+    """
+    Detects (once) and logs whether the CPU offers the instructions the hot paths rely on:
+    AES-NI for encrypted ZIPs, PCLMULQDQ for libdeflate's CRC-32, AVX2 for libdeflate/zstd.
+    Returns a dict of flag -> bool, or None if py-cpuinfo isn't installed.
+    """
+    if cpuinfo is None:
+        logging.info("py-cpuinfo not installed; skipping CPU capability check.")
+        return None
+    try:
+        flags = set(cpuinfo.get_cpu_info().get('flags', []))
+    except Exception as e:
+        log_exception(e)
+        return None
+    caps = {
+        'aes': 'aes' in flags,
+        'pclmulqdq': 'pclmulqdq' in flags,
+        'avx2': 'avx2' in flags,
+    }
+    logging.info(
+        "CPU capabilities - AES-NI: %s, PCLMUL: %s, AVX2: %s; libdeflate: %s",
+        caps['aes'], caps['pclmulqdq'], caps['avx2'], deflate is not None
+    )
+    return caps
+
+class ProgressThrottle:
+    """
+    Wraps a progress callback(current, total) and only forwards calls that move
+    the percentage by at least min_step, arrive min_interval seconds after the
+    last forwarded one, or mark completion. Keeps per-file callbacks from
+    flooding the Tk event queue.
+    """
+
+    def __init__(self, callback, min_step=1.0, min_interval=0.1):
+        self.callback = callback
+        self.min_step = min_step
+        self.min_interval = min_interval
+        self.last_pct = None
+        self.last_time = 0.0
+
+    def __call__(self, current, total):
+        pct = (current / total) * 100 if total > 0 else 100.0
+        now = time.monotonic()
+        if (self.last_pct is None
+                or abs(pct - self.last_pct) >= self.min_step
+                or now - self.last_time >= self.min_interval
+                or current >= total):
+            self.last_pct = pct
+            self.last_time = now
+            self.callback(current, total)
+
+
 ##############################################################################
 # GOOGLE DRIVE AUTH (MAIN THREAD)
 ##############################################################################
@@ -115,17 +248,60 @@ def ensure_google_drive_credentials():
 # FILE / FOLDER UTILS
 ##############################################################################
 
+@dataclass(frozen=True)
+class FileEntry:
+    """
+    A file found under the source folder: absolute path, path inside the archive, size in bytes,
+    plus the mtime and mode from the same stat so tar headers can be filled in without another one.
+    """
+    path: str
+    arcname: str
+    size: int
+    mtime: float
+    mode: int
+
+def enumerate_source(source_folder):
+    """
+    Walks source_folder once and returns (entries, total_bytes), where entries is a
+    list of FileEntry. The space check and the archivers all work from this list
+    so the tree is only listed once per backup.
+    Uses os.scandir so file types (and, on Windows, sizes) come from the
+    directory listing itself rather than a separate stat per path (symlinked
+    files still need one, to get the target's size).
+    """
+    entries = []
+    total_bytes = 0
+    stack = [(source_folder, '')]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as dir_entries:
+                for entry in dir_entries:
+                    arcname = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, arcname))
+                            continue
+                        if not entry.is_file():
+                            continue
+                        # Symlinks to files are followed so their contents get backed up;
+                        # directory symlinks are not descended into
+                        st = entry.stat()
+                    except OSError as e:
+                        # e.g. deleted since the directory was listed; skip just this entry
+                        log_exception(e)
+                        logging.warning(f"Skipping {entry.path}: it could not be read.")
+                        continue
+                    entries.append(FileEntry(entry.path, arcname, st.st_size, st.st_mtime, st.st_mode))
+                    total_bytes += st.st_size
+        except OSError as e:
+            # A directory that can't be listed is skipped, not the whole walk
+            log_exception(e)
+    return entries, total_bytes
+
 def get_folder_size(folder_path):
     """Calculates the total size of the folder in bytes."""
-    total_size = 0
-    for dirpath, dirnames, filenames in os.walk(folder_path):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            try:
-                total_size += os.path.getsize(fp)
-            except Exception as e:
-                log_exception(e)
-    return total_size
+    return enumerate_source(folder_path)[1]
 
 def get_available_space(destination):
     """Returns the available disk space in bytes for the destination."""
@@ -136,10 +312,23 @@ def get_available_space(destination):
         log_exception(e)
         return 0
 
-def confirm_space(source_folder, backup_destination):
-    """Confirms if there's enough space in the backup destination."""
-    source_size = get_folder_size(source_folder)
+def confirm_space(source_folder, backup_destination, source_size=None):
+    """
+    Confirms if there's enough space in the backup destination.
+    source_size may be passed in when the folder has already been measured.
+    If it isn't and the destination has more than SPACE_CHECK_SKIP_BYTES free,
+    the user is asked straight away without walking the source folder.
+    """
     available_space = get_available_space(backup_destination)
+    if source_size is None and available_space > SPACE_CHECK_SKIP_BYTES:
+        logging.info(f"Available space at destination: {available_space} bytes; skipping size check.")
+        return messagebox.askyesno(
+            "Confirm Backup",
+            f"Available space at the destination: {available_space / (1024**3):.2f} GB.\n\n"
+            f"Do you want to proceed?"
+        )
+    if source_size is None:
+        source_size = get_folder_size(source_folder)
     logging.info(f"Source folder size: {source_size} bytes")
     logging.info(f"Available space at destination: {available_space} bytes")
 
@@ -180,42 +369,611 @@ def is_different_drive(source, destination):
 # ZIP & ENCRYPTION
 ##############################################################################
 
-def create_zip_backup(source_folder, backup_destination, progress_callback=None):
+def _deflate_raw(data, level):
+    """Compresses data to a raw DEFLATE stream, with libdeflate when available."""
+    if deflate is not None:
+        return deflate.deflate_compress(data, level)
+    compressor = zlib.compressobj(min(level, 9), zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+def _crc32(data):
+    """CRC-32 of data, using libdeflate's PCLMULQDQ-accelerated version when available."""
+    if deflate is not None:
+        return deflate.crc32(data)
+    return zlib.crc32(data)
+
+def _is_incompressible(file_path):
+    """True if the file's extension marks it as already compressed."""
+    return os.path.splitext(file_path)[1].lower() in INCOMPRESSIBLE_EXTENSIONS
+
+def _compress_file(file_path, level, store=False):
     """
-    Creates a non-encrypted ZIP backup of the source_folder in the backup_destination.
-    progress_callback(current, total) can be used to update a progress bar.
+    Reads and compresses one file, returning (file_size, crc, compressed_bytes, stamp).
+    With store, only the CRC is computed: the data is returned as read, or as None
+    for files of MMAP_THRESHOLD bytes or more, which are copied straight from the
+    file when the entry is appended (see _copy_file_into). For those, stamp is the
+    (size, mtime_ns) the CRC belongs to, so the copy can check the file is unchanged;
+    otherwise it is None.
+    Files of MMAP_THRESHOLD bytes or more are mapped rather than read, so the
+    compressor works straight from the page cache without a copy into a bytes object.
     """
-    folder_name = os.path.basename(source_folder.rstrip(os.sep))
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    zip_filename = f"{folder_name}_backup_{timestamp}.zip"
-    zip_path = os.path.join(backup_destination, zip_filename)
-    logging.info(f"Creating ZIP archive: {zip_path}")
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        size = st.st_size
+        if size < MMAP_THRESHOLD:
+            data = f.read()
+            return len(data), _crc32(data), data if store else _deflate_raw(data, level), None
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if not store:
+                return len(data), _crc32(data), _deflate_raw(data, level), None
+            crc = _crc32(data)
+        stamp = (size, st.st_mtime_ns)
+        after = os.fstat(f.fileno())
+        if (after.st_size, after.st_mtime_ns) != stamp:
+            raise OSError(f"{file_path} changed while being read")
+        return size, crc, None, stamp
+
+def _compress_work_package(items, level):
+    """
+    Runs in a worker process. Compresses each FileEntry in items to raw DEFLATE (or
+    stores it as is if it is already compressed) and lays the entries out back to
+    back as ZIP local file records (header + data), so the main process can append
+    the whole package with few writes.
+    Returns (blob, records) where records holds (entry, zinfo, record_length, stamp)
+    per file, or (entry, None, exception, None) for files that couldn't be read.
+    stamp is set for big stored files: only their header is in the blob, and their
+    data is copied from the file itself right after it, provided the file still
+    matches the (size, mtime_ns) stamp its CRC was computed for.
+    """
+    blob = bytearray()
+    records = []
+    for entry in items:
+        try:
+            store = _is_incompressible(entry.path)
+            zinfo = zipfile.ZipInfo.from_file(entry.path, entry.arcname)
+            zinfo.file_size, zinfo.CRC, compressed, stamp = _compress_file(entry.path, level, store)
+            zinfo.compress_type = zipfile.ZIP_STORED if store else zipfile.ZIP_DEFLATED
+            zinfo.compress_size = zinfo.file_size if compressed is None else len(compressed)
+            # The local header doesn't contain the entry's offset, so it can be built here
+            header = zinfo.FileHeader()
+        except Exception as e:
+            records.append((entry, None, e, None))
+            continue
+        blob += header
+        if compressed is None:
+            records.append((entry, zinfo, len(header), stamp))
+        else:
+            blob += compressed
+            records.append((entry, zinfo, len(header) + len(compressed), None))
+    return blob, records
 
-    total_files = sum(len(files) for _, _, files in os.walk(source_folder))
-    current_file = 0
+# Reused to pad out files that couldn't be copied in full, a slice at a time
+_ZERO_FILL = memoryview(bytes(1024 * 1024))
 
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as backup_zip:
-        for root_dir, dirs, files in os.walk(source_folder):
-            for f in files:
-                file_path = os.path.join(root_dir, f)
+def _copy_file_into(fp, file_path, stamp):
+    """
+    Appends the data of file_path to fp, if its (size, mtime_ns) still matches stamp
+    (the CRC in its header was computed for that version of the file). On Linux, when fp is a real file, the
+    kernel copies them with os.sendfile, page cache to page cache; otherwise (a
+    TeeWriter, other platforms, or sendfile failing part way) they're copied in 1 MiB reads.
+    Always leaves exactly size bytes in fp so later offsets stay valid: if the file
+    changed or can't be read in full, the rest is zero-filled and an OSError is
+    returned. Returns None on success.
+    """
+    size = stamp[0]
+    copied = 0
+    error = None
+    try:
+        with open(file_path, 'rb') as src:
+            st = os.fstat(src.fileno())
+            if (st.st_size, st.st_mtime_ns) != stamp:
+                raise OSError(f"{file_path} changed while being archived")
+            if USE_SENDFILE and hasattr(fp, 'fileno'):
+                fp.flush()
+                start = fp.tell()
                 try:
-                    backup_zip.write(file_path, os.path.relpath(file_path, source_folder))
-                    logging.debug(f"Added {file_path} to ZIP.")
-                except Exception as e:
-                    log_exception(e)
-                    logging.warning(f"Failed to add {file_path} to ZIP.")
+                    while copied < size:
+                        sent = os.sendfile(fp.fileno(), src.fileno(), copied, size - copied)
+                        if sent == 0:
+                            break
+                        copied += sent
+                except OSError as e:
+                    # e.g. EINVAL/ENOSYS where sendfile can't be used here; the loop below copies the rest
+                    logging.debug(f"sendfile failed for {file_path}, copying instead: {e}")
                 finally:
-                    current_file += 1
-                    if progress_callback:
-                        progress_callback(current_file, total_files)
+                    # sendfile moved the descriptor, not the buffered file object
+                    fp.seek(start + copied)
+                # sendfile reads at an offset and leaves src's position alone
+                src.seek(copied)
+            while copied < size:
+                chunk = src.read(min(1024 * 1024, size - copied))
+                if not chunk:
+                    break
+                fp.write(chunk)
+                copied += len(chunk)
+        if copied < size:
+            error = OSError(f"{file_path} shrank while being archived")
+    except OSError as e:
+        error = e
+    while copied < size:
+        n = min(len(_ZERO_FILL), size - copied)
+        fp.write(_ZERO_FILL[:n])
+        copied += n
+    return error
+
+def _append_records(backup_zip, blob, records):
+    """
+    Appends a package built by _compress_work_package: writes the blob (in one go
+    unless file data has to be copied in between) and registers each entry for the
+    central directory, mirroring the bookkeeping ZipFile.open(..., 'w') does minus
+    the compression step.
+    Returns the list of (entry, error) for entries that were rejected. If it raises,
+    none of the package is left in the central directory and later entries are
+    written after whatever part of it reached the file.
+    """
+    rejected = []
+    view = memoryview(blob)
+    with backup_zip._lock:
+        fp = backup_zip.fp
+        first_added = len(backup_zip.filelist)
+        replaced = {}
+        backup_zip._didModify = True
+        try:
+            offset = fp.tell()
+            written = 0
+            pos = 0
+            for entry, zinfo, length, stamp in records:
+                if zinfo is None:
+                    continue
+                copy_size = zinfo.compress_size if stamp is not None else 0
+                zinfo.header_offset = offset
+                offset += length + copy_size
+                pos += length
+                if copy_size:
+                    fp.write(view[written:pos])
+                    written = pos
+                    error = _copy_file_into(fp, entry.path, stamp)
+                    if error is not None:
+                        # Its bytes are already in the file but it stays out of the directory
+                        rejected.append((entry, error))
+                        continue
+                try:
+                    backup_zip._writecheck(zinfo)
+                except Exception as e:
+                    # Its bytes are already in the file but it stays out of the directory
+                    rejected.append((entry, e))
+                    continue
+                replaced.setdefault(zinfo.filename, backup_zip.NameToInfo.get(zinfo.filename))
+                backup_zip.filelist.append(zinfo)
+                backup_zip.NameToInfo[zinfo.filename] = zinfo
+            fp.write(view[written:])
+        except BaseException:
+            del backup_zip.filelist[first_added:]
+            for name, previous in replaced.items():
+                if previous is None:
+                    del backup_zip.NameToInfo[name]
+                else:
+                    backup_zip.NameToInfo[name] = previous
+            raise
+        finally:
+            # ZipFile.open(..., 'w') seeks here before writing the next entry
+            backup_zip.start_dir = fp.tell()
+    return rejected
+
+def _write_large_file(backup_zip, entry):
+    """
+    Streams one large file into backup_zip on this thread. The entry is written as
+    ZIP64 from the start, so a file that grows past 4 GiB while it is being read
+    doesn't abort the entry.
+    """
+    zinfo = zipfile.ZipInfo.from_file(entry.path, entry.arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo._compresslevel = min(COMPRESSION_LEVEL, 9)
+    with open(entry.path, 'rb') as src, backup_zip.open(zinfo, 'w', force_zip64=True) as dest:
+        shutil.copyfileobj(src, dest, 1024 * 1024)
 
-    logging.info(f"Backup created successfully at {zip_path}")
-    return zip_path
+def _package_memory_bytes(package):
+    """
+    Upper bound on the file data a work package holds in memory: everything but
+    big stored files, which the workers only checksum and never return.
+    """
+    return sum(
+        entry.size for entry in package
+        if entry.size < MMAP_THRESHOLD or not _is_incompressible(entry.path)
+    )
 
-def create_encrypted_zip(source_folder, backup_destination, password, progress_callback=None):
+def _iter_work_packages(items):
+    """Groups FileEntry items into lists holding ~WORK_PACKAGE_BYTES of file data each."""
+    package, package_bytes = [], 0
+    for entry in items:
+        package.append(entry)
+        package_bytes += entry.size
+        if package_bytes >= WORK_PACKAGE_BYTES:
+            yield package
+            package, package_bytes = [], 0
+    if package:
+        yield package
+
+# fallocate(2) flag: reserve blocks without changing the file size
+FALLOC_FL_KEEP_SIZE = 0x01
+
+@functools.lru_cache(maxsize=1)
+def _libc_fallocate():
     """
-    Creates an encrypted ZIP backup of the source_folder in the backup_destination using pyminizip.
-    progress_callback(current, total) can be used to update a progress bar (pyminizip doesn't natively support progress).
+    Returns libc's fallocate64 (Linux only), or None. os.posix_fallocate can't be
+    used: on filesystems without native support (FAT/exFAT, ntfs-3g, NFSv3) glibc
+    emulates it by writing zeros over the whole range, doubling the I/O.
+    """
+    if platform.system() != "Linux":
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        fallocate = libc.fallocate64
+    except (OSError, AttributeError):
+        return None
+    fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    fallocate.restype = ctypes.c_int
+    return fallocate
+
+def _preallocate(f, size):
+    """
+    Reserves size bytes of disk space for the open file f up front, so a multi-GB
+    archive isn't grown (and fragmented) write by write. The file's size doesn't
+    change, and the caller truncates it once done to release what went unused.
+    Only done where the filesystem supports fallocate natively; elsewhere the
+    archive just grows as usual.
+    """
+    fallocate = _libc_fallocate()
+    if size <= 0 or fallocate is None:
+        return
+    if fallocate(f.fileno(), FALLOC_FL_KEEP_SIZE, 0, size) != 0:
+        # e.g. EOPNOTSUPP on a filesystem without native fallocate
+        err = ctypes.get_errno()
+        logging.debug(f"Could not preallocate {size} bytes: {os.strerror(err)}")
+
+class TeeWriter:
+    """
+    Write-only file for ZipFile that saves the archive to disk while a reader (the
+    Drive upload) follows along behind. Written bytes are published to readers every
+    UPLOAD_CHUNK_SIZE; readers read them back from the file, so nothing is held in
+    memory. There is no seek(), so ZipFile writes entries strictly in order.
+    """
+
+    def __init__(self, path, reserve_bytes=0):
+        self.path = path
+        self._file = open(path, 'wb')
+        _preallocate(self._file, reserve_bytes)
+        self._cond = threading.Condition()
+        self._written = 0
+        self._published = 0
+        self._closed = False
+        self._aborted = False
+
+    def write(self, data):
+        n = self._file.write(data)
+        self._written += n
+        if self._written - self._published >= UPLOAD_CHUNK_SIZE:
+            self._publish()
+        return n
+
+    def tell(self):
+        return self._written
+
+    def flush(self):
+        self._file.flush()
+
+    def _publish(self, closed=False, aborted=False):
+        self._file.flush()
+        with self._cond:
+            self._published = self._written
+            self._closed = closed
+            self._aborted = aborted
+            self._cond.notify_all()
+
+    def close(self):
+        """Publishes the rest of the file and tells readers it is complete."""
+        self._publish(closed=True)
+        self._file.truncate()
+        self._file.close()
+
+    def abort(self):
+        """Closes the file and makes waiting readers fail; the archive is incomplete."""
+        self._publish(closed=True, aborted=True)
+        self._file.truncate()
+        self._file.close()
+
+    def wait_for(self, size):
+        """
+        Blocks until at least size bytes are published or the file is closed.
+        Returns (bytes_published, closed); raises OSError if the writer aborted.
+        """
+        with self._cond:
+            while self._published < size and not self._closed:
+                self._cond.wait()
+            if self._aborted:
+                raise OSError(f"{self.path} was not completed")
+            return self._published, self._closed
+
+class _ZipVolumeSet:
+    """
+    Hands out the ZipFile currently being written. With a volume_size, the current
+    volume is closed once it grows past that size and the next entry starts a new
+    one; every volume is a complete ZIP of its own. on_volume_done(path) is called
+    as each volume is finished. With on_volume_start, each volume is written through
+    a TeeWriter and on_volume_start(path, tee) is called as soon as it is opened.
+    expected_size is the estimated size of the whole backup; each volume file is
+    preallocated to its share of it and truncated to the real size when finished.
+    """
+
+    def __init__(self, base_path, volume_size=None, on_volume_done=None, on_volume_start=None,
+                 expected_size=0):
+        self.base_path = base_path
+        self.volume_size = volume_size
+        self.on_volume_done = on_volume_done
+        self.on_volume_start = on_volume_start
+        self.paths = []
+        self._zip = None
+        self._file = None
+        self._remaining_estimate = expected_size
+
+    def _next_path(self):
+        if not self.volume_size:
+            return f"{self.base_path}.zip"
+        return f"{self.base_path}_part{len(self.paths) + 1:03d}.zip"
+
+    def current(self):
+        if self._zip is None:
+            path = self._next_path()
+            logging.info(f"Creating ZIP archive: {path}")
+            reserve_bytes = self._remaining_estimate
+            if self.volume_size:
+                reserve_bytes = min(reserve_bytes, self.volume_size)
+            if self.on_volume_start:
+                self._file = TeeWriter(path, reserve_bytes)
+            else:
+                self._file = open(path, 'w+b')
+                _preallocate(self._file, reserve_bytes)
+            self._zip = zipfile.ZipFile(self._file, 'w', zipfile.ZIP_DEFLATED, compresslevel=min(COMPRESSION_LEVEL, 9))
+            self.paths.append(path)
+            if self.on_volume_start:
+                self.on_volume_start(path, self._file)
+        return self._zip
+
+    def entry_written(self):
+        if self.volume_size and self._zip is not None and self._zip.fp.tell() >= self.volume_size:
+            self._finish_volume()
+
+    def _release_file(self, aborted=False):
+        # Cut off whatever was preallocated but not written
+        self._remaining_estimate -= self._file.tell()
+        if isinstance(self._file, TeeWriter):
+            if aborted:
+                self._file.abort()
+            else:
+                self._file.close()
+        else:
+            self._file.truncate()
+            self._file.close()
+        self._file = None
+
+    def _finish_volume(self):
+        self._zip.close()
+        self._zip = None
+        self._release_file()
+        if self.on_volume_done:
+            self.on_volume_done(self.paths[-1])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # On failure just release the open volume; don't announce it as finished
+        if exc_type is not None and self._zip is not None:
+            self._zip.close()
+            self._zip = None
+            self._release_file(aborted=True)
+        return False
+
+    def close(self):
+        """Finishes the last volume (creating an empty archive if nothing was written) and returns all paths."""
+        if self._zip is None and not self.paths:
+            self.current()
+        if self._zip is not None:
+            self._finish_volume()
+        return self.paths
+
+class _PaddedReader:
+    """
+    Wraps a file opened for tar. A file that shrank since it was listed is padded
+    with zeros (as GNU tar does) so the stream stays valid instead of breaking mid-entry.
+    """
+    def __init__(self, f, path):
+        self._f = f
+        self._path = path
+        self._warned = False
+
+    def read(self, size):
+        data = self._f.read(size)
+        if len(data) < size:
+            if not self._warned:
+                logging.warning(f"{self._path} shrank while being archived; padding with zeros.")
+                self._warned = True
+            data += bytes(size - len(data))
+        return data
+
+def _tarinfo_for(entry):
+    """Builds a TarInfo from the stat data cached in a FileEntry."""
+    tarinfo = tarfile.TarInfo(entry.arcname.replace(os.sep, '/'))
+    tarinfo.size = entry.size
+    tarinfo.mtime = entry.mtime
+    tarinfo.mode = stat.S_IMODE(entry.mode)
+    return tarinfo
+
+def _write_tar(fileobj, entries, progress_callback, label):
+    """Streams entries as an uncompressed tar into fileobj (a compressor)."""
+    total_bytes = sum(entry.size for entry in entries)
+    bytes_done = 0
+    with tarfile.open(fileobj=fileobj, mode='w|') as tar:
+        for entry in entries:
+            try:
+                with open(entry.path, 'rb') as f:
+                    tar.addfile(_tarinfo_for(entry), _PaddedReader(f, entry.path))
+            except OSError as e:
+                log_exception(e)
+                logging.warning(f"Failed to add {entry.path} to {label}.")
+            finally:
+                bytes_done += entry.size
+                if progress_callback:
+                    progress_callback(bytes_done, total_bytes)
+
+def create_tar_zst(base_path, entries, progress_callback=None):
+    """
+    Writes entries to base_path + '.tar.zst' as a tar stream compressed by zstd,
+    which compresses on all cores itself (threads=-1).
+    progress_callback(bytes_done, total_bytes) can be used to update a progress bar.
+    """
+    archive_path = f"{base_path}.tar.zst"
+    logging.info(f"Creating tar.zst archive: {archive_path}")
+    cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1, write_checksum=True)
+    with open(archive_path, 'wb') as out_file, cctx.stream_writer(out_file) as compressor:
+        _write_tar(compressor, entries, progress_callback, 'tar.zst')
+    return archive_path
+
+def create_tar_gz(base_path, entries, progress_callback=None):
+    """
+    Writes entries to base_path + '.tar.gz'. mgzip compresses GZIP_BLOCK_SIZE blocks
+    on all cores and concatenates them as gzip members, which any gunzip/tar can read.
+    progress_callback(bytes_done, total_bytes) can be used to update a progress bar.
+    """
+    archive_path = f"{base_path}.tar.gz"
+    logging.info(f"Creating tar.gz archive: {archive_path}")
+    with mgzip.open(archive_path, 'wb', compresslevel=min(COMPRESSION_LEVEL, 9),
+                    thread=os.cpu_count(), blocksize=GZIP_BLOCK_SIZE) as compressor:
+        _write_tar(compressor, entries, progress_callback, 'tar.gz')
+    return archive_path
+
+# Archive formats written as a single compressed tar stream
+TAR_WRITERS = {'tar.zst': create_tar_zst, 'tar.gz': create_tar_gz}
+
+def create_zip_backup(source_folder, backup_destination, progress_callback=None, entries=None,
+                      volume_size=None, on_volume_done=None, archive_format='zip', on_volume_start=None):
+    """
+    Creates a non-encrypted ZIP backup of the source_folder in the backup_destination.
+    With archive_format 'tar.zst' or 'tar.gz' a single compressed tarball is written instead
+    (volume_size does not apply; on_volume_done is still called once it is finished).
+    Small and medium files are compressed in parallel worker processes; large files
+    are streamed through ZipFile on this thread afterwards.
+    entries is the FileEntry list from enumerate_source; the folder is walked if omitted.
+    With volume_size, the backup is split into self-contained ZIP volumes of roughly
+    that many bytes, and on_volume_done(path) is called as each one is finished.
+    on_volume_start(path, tee) is called as each ZIP volume is opened, with the
+    TeeWriter it is written through, so it can be read while it is still growing.
+    progress_callback(bytes_done, total_bytes) can be used to update a progress bar.
+    Returns the list of archive paths written.
+    """
+    folder_name = os.path.basename(source_folder.rstrip(os.sep))
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base_path = os.path.join(backup_destination, f"{folder_name}_backup_{timestamp}")
+    if entries is None:
+        entries, _ = enumerate_source(source_folder)
+
+    if archive_format in TAR_WRITERS:
+        archive_path = TAR_WRITERS[archive_format](base_path, entries, progress_callback)
+        if on_volume_done:
+            on_volume_done(archive_path)
+        logging.info(f"Backup created successfully at {archive_path}")
+        return [archive_path]
+
+    # Large stored files go to the workers too: only their CRC is computed there
+    # (over a mapping) and the data is copied straight from the file when appended
+    small_files, large_files = [], []
+    for entry in entries:
+        if entry.size > LARGE_FILE_THRESHOLD and not _is_incompressible(entry.path):
+            large_files.append(entry)
+        else:
+            small_files.append(entry)
+
+    # Progress is measured in bytes so a few huge files don't stall the bar
+    total_bytes = sum(entry.size for entry in entries)
+    volumes = _ZipVolumeSet(base_path, volume_size, on_volume_done, on_volume_start,
+                            expected_size=int(total_bytes * ZIP_SIZE_ESTIMATE))
+    bytes_done = 0
+    files_done = 0
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    def file_done(entry):
+        nonlocal bytes_done, files_done
+        bytes_done += entry.size
+        files_done += 1
+        if files_done % LOG_BATCH_FILES == 0:
+            logger.info("Processed %d of %d files (%d of %d bytes).", files_done, len(entries), bytes_done, total_bytes)
+        if progress_callback:
+            progress_callback(bytes_done, total_bytes)
+
+    def write_package(blob, records):
+        # Entries the worker couldn't read carry their exception in place of a length
+        errors = {entry: error for entry, zinfo, error, _ in records if zinfo is None}
+        try:
+            errors.update(_append_records(volumes.current(), blob, records))
+        except Exception as e:
+            log_exception(e)
+            errors.update((entry, e) for entry, zinfo, _, _ in records if zinfo is not None)
+        for entry, _, _, _ in records:
+            if entry in errors:
+                logging.error(f"Exception occurred: {errors[entry]}")
+                logging.warning(f"Failed to add {entry.path} to ZIP.")
+            elif debug_enabled:
+                logger.debug("Added %s to ZIP.", entry.path)
+            file_done(entry)
+        volumes.entry_written()
+
+    with volumes:
+        if small_files:
+            workers = os.cpu_count() or 1
+            # Bound the results held in memory: at most a couple of packages per worker,
+            # and at most MAX_IN_FLIGHT_BYTES of file data (always at least one package)
+            max_in_flight = workers * 2
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                in_flight_bytes = 0
+                for package in _iter_work_packages(small_files):
+                    package_bytes = _package_memory_bytes(package)
+                    future = pool.submit(_compress_work_package, package, COMPRESSION_LEVEL)
+                    pending.append((future, package_bytes))
+                    in_flight_bytes += package_bytes
+                    while pending and (len(pending) >= max_in_flight or in_flight_bytes >= MAX_IN_FLIGHT_BYTES):
+                        future, package_bytes = pending.popleft()
+                        write_package(*future.result())
+                        in_flight_bytes -= package_bytes
+                while pending:
+                    future, _ = pending.popleft()
+                    write_package(*future.result())
+
+        for entry in large_files:
+            try:
+                _write_large_file(volumes.current(), entry)
+                if debug_enabled:
+                    logger.debug("Added %s to ZIP.", entry.path)
+            except Exception as e:
+                log_exception(e)
+                logging.warning(f"Failed to add {entry.path} to ZIP.")
+            finally:
+                volumes.entry_written()
+                file_done(entry)
+
+        zip_paths = volumes.close()
+
+    logging.info(f"Backup created successfully at {', '.join(zip_paths)}")
+    return zip_paths
+
+def create_encrypted_zip(source_folder, backup_destination, password, progress_callback=None, entries=None):
+    """
+    Creates an AES-256 encrypted ZIP backup of the source_folder in the backup_destination using pyzipper.
+    pyzipper's AES runs through pycryptodomex, which uses AES-NI where the CPU has it.
+    entries is the FileEntry list from enumerate_source; the folder is walked if omitted.
+    progress_callback(bytes_done, total_bytes) can be used to update a progress bar.
     """
     folder_name = os.path.basename(source_folder.rstrip(os.sep))
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -223,22 +981,30 @@ def create_encrypted_zip(source_folder, backup_destination, password, progress_c
     zip_path = os.path.join(backup_destination, zip_filename)
     logging.info(f"Creating encrypted ZIP archive: {zip_path}")
 
-    # Collect all file paths
-    file_paths = []
-    for root_dir, dirs, files in os.walk(source_folder):
-        for f in files:
-            file_paths.append(os.path.join(root_dir, f))
-
-    # pyminizip doesn't have built-in progress callback, so we can only do a naive approach
-    # or skip progress updates. We'll skip it here for simplicity.
-    compression_level = 5
-    pyminizip.compress_multiple(
-        file_paths,
-        [source_folder]*len(file_paths),
-        zip_path,
-        password,
-        compression_level
-    )
+    if entries is None:
+        entries, _ = enumerate_source(source_folder)
+
+    total_bytes = sum(entry.size for entry in entries)
+    bytes_done = 0
+    with pyzipper.AESZipFile(
+        zip_path, 'w',
+        compression=pyzipper.ZIP_DEFLATED,
+        encryption=pyzipper.WZ_AES
+    ) as backup_zip:
+        backup_zip.setpassword(password.encode())
+        for entry in entries:
+            try:
+                if _is_incompressible(entry.path):
+                    backup_zip.write(entry.path, entry.arcname, compress_type=pyzipper.ZIP_STORED)
+                else:
+                    backup_zip.write(entry.path, entry.arcname)
+            except Exception as e:
+                log_exception(e)
+                logging.warning(f"Failed to add {entry.path} to encrypted ZIP.")
+            finally:
+                bytes_done += entry.size
+                if progress_callback:
+                    progress_callback(bytes_done, total_bytes)
 
     logging.info(f"Encrypted backup created successfully at {zip_path}")
     return zip_path
@@ -248,27 +1014,165 @@ def create_encrypted_zip(source_folder, backup_destination, password, progress_c
 # GOOGLE DRIVE UPLOAD
 ##############################################################################
 
-def upload_to_google_drive(creds, file_path, folder_id=None):
+# The Drive service object is built once and reused for every upload
+_DRIVE_SERVICE = None
+_DRIVE_SERVICE_CREDS = None
+_DRIVE_SERVICE_LOCK = threading.Lock()
+
+def get_drive_service(creds):
+    """
+    Returns a cached Drive v3 service for creds, building it on first use.
+    static_discovery uses the discovery document bundled with
+    google-api-python-client, so no network round trip is needed.
+    """
+    global _DRIVE_SERVICE, _DRIVE_SERVICE_CREDS
+    with _DRIVE_SERVICE_LOCK:
+        if _DRIVE_SERVICE is None or _DRIVE_SERVICE_CREDS is not creds:
+            _DRIVE_SERVICE = build(
+                'drive', 'v3', credentials=creds,
+                cache_discovery=False, static_discovery=True
+            )
+            _DRIVE_SERVICE_CREDS = creds
+        return _DRIVE_SERVICE
+
+class _TeeUpload(MediaUpload):
+    """
+    Resumable media for a file that is still being written through a TeeWriter.
+    Its size is reported as unknown until the writer closes. Chunks are read back
+    from the file, so a chunk that has to be re-sent is simply read again.
+    """
+
+    def __init__(self, tee, mimetype, chunksize):
+        super().__init__()
+        self._tee = tee
+        self._mimetype = mimetype
+        self._chunksize = chunksize
+        self._file = None
+        self._next = 0
+
+    def chunksize(self):
+        return self._chunksize
+
+    def mimetype(self):
+        return self._mimetype
+
+    def size(self):
+        # Asked before each chunk is sent. Waiting until that chunk is either full
+        # with a byte to spare or the last one means the total is always known by
+        # the time the final bytes go out (a full-size last chunk sent with an
+        # unknown total couldn't be finished off).
+        published, closed = self._tee.wait_for(self._next + self._chunksize + 1)
+        return published if closed else None
+
+    def resumable(self):
+        return True
+
+    def getbytes(self, begin, length):
+        published, _closed = self._tee.wait_for(begin + length)
+        if self._file is None:
+            self._file = open(self._tee.path, 'rb')
+        self._file.seek(begin)
+        data = self._file.read(min(length, published - begin))
+        self._next = begin + len(data)
+        return data
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+def upload_to_google_drive(creds, file_path, folder_id=None, progress_callback=None, tee=None):
     """
     Uploads a file to Google Drive using existing OAuth credentials.
     If folder_id is specified, the file is placed in that Drive folder.
+    The upload is resumable and sent in UPLOAD_CHUNK_SIZE pieces;
+    progress_callback(bytes_sent, total_bytes) is called after each chunk.
+    If tee is the TeeWriter file_path is still being written through, the upload
+    follows the writer and finishes once it is closed.
+    Returns True on success.
     """
+    media = None
     try:
-        service = build('drive', 'v3', credentials=creds)
+        service = get_drive_service(creds)
+        # Each upload gets its own connection; httplib2 objects aren't thread-safe.
+        # build_http() sets a timeout and doesn't treat Drive's "308 Resume Incomplete" as a redirect.
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=build_http())
         file_metadata = {'name': os.path.basename(file_path)}
         if folder_id:
             file_metadata['parents'] = [folder_id]
-        media = MediaFileUpload(file_path, mimetype='application/zip')
-        file = service.files().create(
+        mimetype = 'application/zip' if file_path.endswith('.zip') else 'application/octet-stream'
+        if tee is not None:
+            media = _TeeUpload(tee, mimetype, UPLOAD_CHUNK_SIZE)
+        else:
+            media = MediaFileUpload(file_path, mimetype=mimetype, resumable=True, chunksize=UPLOAD_CHUNK_SIZE)
+        request = service.files().create(
             body=file_metadata,
             media_body=media,
             fields='id'
-        ).execute()
+        )
+        file = None
+        while file is None:
+            status, file = request.next_chunk(http=http)
+            if status and progress_callback:
+                progress_callback(status.resumable_progress, status.total_size)
+        if progress_callback:
+            total = tee.tell() if tee is not None else media.size()
+            progress_callback(total, total)
         logging.info(f"Uploaded {file_path} to Google Drive (File ID: {file.get('id')})")
+        return True
     except Exception as e:
         log_exception(e)
         messagebox.showerror("Upload Error", f"Failed to upload {file_path} to Google Drive:\n{e}")
+        return False
+    finally:
+        if isinstance(media, _TeeUpload):
+            media.close()
 
+class DriveUploader:
+    """
+    Uploads files to Google Drive on a small thread pool as they are handed over
+    with submit(), so uploading can start while later files are still being made.
+    submit_tee() starts uploading a file that is still being written through a TeeWriter.
+    progress_callback(bytes_sent, total_bytes) reports the combined progress of
+    everything submitted so far.
+    """
+
+    def __init__(self, creds, folder_id=None, progress_callback=None):
+        self.creds = creds
+        self.folder_id = folder_id
+        self.progress_callback = progress_callback
+        self._pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_UPLOADS)
+        self._futures = []
+        self._lock = threading.Lock()
+        self._sent = {}
+        self._total_bytes = 0
+        self._tees = []
+
+    def submit(self, file_path):
+        with self._lock:
+            self._sent[file_path] = 0
+            self._total_bytes += os.path.getsize(file_path)
+        self._futures.append(self._pool.submit(self._upload, file_path))
+
+    def submit_tee(self, file_path, tee):
+        with self._lock:
+            self._sent[file_path] = 0
+            self._tees.append(tee)
+        self._futures.append(self._pool.submit(self._upload, file_path, tee))
+
+    def _upload(self, file_path, tee=None):
+        def on_chunk(bytes_sent, _total):
+            with self._lock:
+                self._sent[file_path] = bytes_sent
+                done = sum(self._sent.values())
+                total = self._total_bytes + sum(t.tell() for t in self._tees)
+            if self.progress_callback:
+                self.progress_callback(done, total)
+        return upload_to_google_drive(self.creds, file_path, self.folder_id, progress_callback=on_chunk, tee=tee)
+
+    def wait(self):
+        """Blocks until every submitted upload has finished. Returns True if all succeeded."""
+        self._pool.shutdown(wait=True)
+        return all(future.result() for future in self._futures)
 
 ##############################################################################
 # BACKGROUND THREAD: PERFORM BACKUP & UPLOAD
@@ -277,40 +1181,69 @@ def upload_to_google_drive(creds, file_path, folder_id=None):
 def background_backup_task(
     source_folder, backup_destination,
     encrypt, password, do_upload, creds,
-    update_progress, update_status
+    update_progress, update_status,
+    entries=None, archive_format='zip'
 ):
     """
     This function runs in a background thread:
-      - Creates the ZIP (encrypted or not).
+      - Creates the ZIP (encrypted or not), or a tar.zst/tar.gz if archive_format says so.
       - Optionally uploads to Google Drive using 'creds'.
     'update_progress(current, total)' and 'update_status(text)' are callbacks
     to update the GUI in a thread-safe manner (usually via root.after).
+    'entries' is an optional FileEntry list from enumerate_source; when omitted
+    (e.g. scheduled runs) the folder is walked fresh.
     """
 
     try:
         update_status("Creating Backup...")
+        # We can pass a progress callback so we can update the progress bar
+        def on_progress(current, total):
+            update_progress(current, total)
+
+        # When uploading, each ZIP volume is uploaded while it is being written
+        # (other formats once they're finished). Upload progress is only shown once
+        # compression is done, so the two don't fight over the progress bar.
+        uploader = None
+        compression_done = threading.Event()
+        if do_upload and creds:
+            def on_upload_progress(sent, total):
+                if compression_done.is_set():
+                    update_progress(sent, total)
+            uploader = DriveUploader(creds, progress_callback=on_upload_progress)
+
         if encrypt and password:
-            # create_encrypted_zip doesn't provide per-file callback, so no progress updates
-            zip_path = create_encrypted_zip(
-                source_folder, backup_destination, password
-            )
+            zip_paths = [create_encrypted_zip(
+                source_folder, backup_destination, password,
+                progress_callback=on_progress, entries=entries
+            )]
+            if uploader:
+                uploader.submit(zip_paths[0])
         else:
-            # We can pass a progress callback so we can update the progress bar
-            def on_progress(current, total):
-                update_progress(current, total)
-
-            zip_path = create_zip_backup(
-                source_folder, backup_destination, progress_callback=on_progress
+            zip_paths = create_zip_backup(
+                source_folder, backup_destination,
+                progress_callback=on_progress, entries=entries,
+                volume_size=UPLOAD_VOLUME_SIZE if uploader else None,
+                on_volume_start=uploader.submit_tee if uploader else None,
+                on_volume_done=uploader.submit if uploader and archive_format != 'zip' else None,
+                archive_format=archive_format
             )
+        compression_done.set()
 
         update_status("Backup Completed")
 
-        if do_upload and creds:
+        if uploader:
             update_status("Uploading to Google Drive...")
-            upload_to_google_drive(creds, zip_path)
+            if not uploader.wait():
+                update_status("Upload Failed")
+                messagebox.showerror(
+                    "Upload Error",
+                    "The backup was created, but at least one part of it failed to upload,\n"
+                    "so the copy on Google Drive is incomplete.\n\n" + "\n".join(zip_paths)
+                )
+                return
             update_status("Upload Completed")
 
-        messagebox.showinfo("Success", f"Backup (and upload) finished.\n\n{zip_path}")
+        messagebox.showinfo("Success", "Backup (and upload) finished.\n\n" + "\n".join(zip_paths))
     except Exception as e:
         log_exception(e)
         messagebox.showerror("Error", f"An error occurred in the background backup:\n{e}")
@@ -321,12 +1254,32 @@ def background_backup_task(
 # MAIN THREAD: USER INTERFACE / DIALOGS
 ##############################################################################
 
-def on_backup_button(root, encrypt, upload, choose_storage):
+def check_archive_format(encrypt, archive_format):
+    """Validates the chosen archive format on the main thread. Returns False if the backup can't go ahead."""
+    if archive_format == 'tar.zst' and not encrypt and zstandard is None:
+        messagebox.showerror(
+            "Format Unavailable",
+            "The 'zstandard' package is not installed, so tar.zst backups can't be created."
+        )
+        return False
+    if archive_format == 'tar.gz' and not encrypt and mgzip is None:
+        messagebox.showerror(
+            "Format Unavailable",
+            "The 'mgzip' package is not installed, so tar.gz backups can't be created."
+        )
+        return False
+    if archive_format != 'zip' and encrypt:
+        messagebox.showinfo("Archive Format", "Encrypted backups are always created as ZIP files.")
+    return True
+
+def on_backup_button(root, encrypt, upload, choose_storage, archive_format='zip'):
     """
     Called on main thread when user clicks "Select Folder to Backup".
     1. All user interaction (folder dialogs, confirm dialogs, password prompts, drive auth) happens here.
     2. Then we start a background thread for the actual backup/zip/upload.
     """
+    if not check_archive_format(encrypt, archive_format):
+        return
 
     # 1. Ask user for source folder
     logging.info("Opening folder selection dialog.")
@@ -367,13 +1320,24 @@ def on_backup_button(root, encrypt, upload, choose_storage):
         os.makedirs(backup_destination, exist_ok=True)
         logging.info(f"Using default backup location: {backup_destination}")
 
-    # 4. Confirm enough space
-    if not confirm_space(source_folder, backup_destination):
+    # 4. Confirm enough space. The folder is only walked up front when free space is
+    # tight; the listing is then reused for the backup, otherwise the worker walks it.
+    entries, source_size = None, None
+    if get_available_space(backup_destination) <= SPACE_CHECK_SKIP_BYTES:
+        entries, source_size = enumerate_source(source_folder)
+    if not confirm_space(source_folder, backup_destination, source_size=source_size):
         return
 
     # 5. If encryption is checked, prompt for password (on main thread)
     password = None
     if encrypt:
+        caps = get_cpu_capabilities()
+        if caps is not None and not caps['aes']:
+            messagebox.showwarning(
+                "Slow Encryption",
+                "This CPU does not report AES-NI, so encryption will run in software\n"
+                "and large backups may take noticeably longer."
+            )
         password = simpledialog.askstring("Password", "Enter a password for the backup ZIP file:", show='*')
         if not password:
             messagebox.showerror("Password Required", "A password is required to create an encrypted backup.")
@@ -389,7 +1353,7 @@ def on_backup_button(root, encrypt, upload, choose_storage):
 
     # 7. Start the background thread for the actual backup
     # We'll define a couple helper functions so we can safely update the GUI
-    def update_progress(current, total):
+    def post_progress(current, total):
         # use root.after to update the progress bar from the background
         def _set_progress():
             if total > 0:
@@ -397,6 +1361,9 @@ def on_backup_button(root, encrypt, upload, choose_storage):
                 root.progress['value'] = pct
         root.after(0, _set_progress)
 
+    # Only post when the bar would visibly move (or 100 ms have passed)
+    update_progress = ProgressThrottle(post_progress)
+
     def update_status(text):
         def _set_status():
             root.status_label.config(text=f"Status: {text}")
@@ -408,16 +1375,19 @@ def on_backup_button(root, encrypt, upload, choose_storage):
         args=(
             source_folder, backup_destination,
             encrypt, password, upload, creds,
-            update_progress, update_status
+            update_progress, update_status,
+            entries, archive_format
         ),
         daemon=True
     ).start()
 
-def on_schedule_backup_button(root, encrypt, upload, choose_storage):
+def on_schedule_backup_button(root, encrypt, upload, choose_storage, archive_format='zip'):
     """
     Similar to on_backup_button but for scheduling.
     We'll gather all info on main thread, then schedule a background job.
     """
+    if not check_archive_format(encrypt, archive_format):
+        return
     # 1. Ask user for source folder
     source_folder = filedialog.askdirectory()
     if not source_folder:
@@ -471,7 +1441,8 @@ def on_schedule_backup_button(root, encrypt, upload, choose_storage):
                 source_folder, backup_destination,
                 encrypt, password, upload, creds,
                 lambda c, t: None,  # no progress updates in scheduled
-                lambda txt: None
+                lambda txt: None,
+                archive_format=archive_format
             )
         except Exception as e:
             log_exception(e)
@@ -483,7 +1454,10 @@ def on_schedule_backup_button(root, encrypt, upload, choose_storage):
     def run_schedule_loop():
         while True:
             schedule.run_pending()
-            time.sleep(1)
+            # Sleep until the next job is due instead of waking every second; capped at
+            # a minute so jobs scheduled later (or clock changes) are still noticed
+            idle = schedule.idle_seconds()
+            time.sleep(min(60, max(1, idle if idle is not None else 60)))
 
     # Start a background thread that runs the schedule loop
     threading.Thread(target=run_schedule_loop, daemon=True).start()
@@ -496,9 +1470,11 @@ def on_schedule_backup_button(root, encrypt, upload, choose_storage):
 def setup_gui():
     """Sets up the GUI for the backup application."""
     logging.info("Setting up the GUI.")
+    # Detecting CPU features can take a moment; do it off the main thread
+    threading.Thread(target=get_cpu_capabilities, daemon=True).start()
     root = Tk()
     root.title("Backup System")
-    root.geometry("600x600")
+    root.geometry("600x660")
     root.resizable(False, False)
 
     label = Label(root, text="Backup System", font=("Helvetica", 16))
@@ -525,6 +1501,14 @@ def setup_gui():
     )
     upload_checkbox.pack(pady=5)
 
+    format_label = Label(root, text="Archive Format:")
+    format_label.pack(pady=(5, 0))
+    format_var = StringVar(value=ARCHIVE_FORMATS[0])
+    format_combobox = ttk.Combobox(
+        root, textvariable=format_var, values=ARCHIVE_FORMATS, state='readonly', width=10
+    )
+    format_combobox.pack(pady=5)
+
     progress = ttk.Progressbar(root, orient='horizontal', length=500, mode='determinate')
     progress.pack(pady=10)
 
@@ -539,7 +1523,8 @@ def setup_gui():
             root,
             encrypt_var.get(),
             upload_var.get(),
-            choose_storage_var.get()
+            choose_storage_var.get(),
+            format_var.get()
         ),
         width=25,
         height=2
@@ -554,7 +1539,8 @@ def setup_gui():
             root,
             encrypt_var.get(),
             upload_var.get(),
-            choose_storage_var.get()
+            choose_storage_var.get(),
+            format_var.get()
         ),
         width=25,
         height=2